@@ -2,7 +2,12 @@
 import streamlit as st
 from streamlit_local_storage import LocalStorage
 import ollama
+import functools
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # --- APP CONFIGURATION ---
 st.set_page_config(page_title="Public Health Educator", page_icon="🏥")
@@ -115,6 +120,281 @@ API_KEY_URLS = {
     "perplexity": "https://www.perplexity.ai/settings/api"
 }
 
+# --- FOLLOW-UP PREFETCH SETTINGS ---
+PREFETCH_SUGGESTION_COUNT = 3    # Follow-up questions suggested after each reply
+PREFETCH_TTL_SECONDS = 600       # Prefetched answers expire after 10 minutes
+PREFETCH_MAX_CONCURRENT = 2      # Max in-flight prefetches per session
+PREFETCH_MAX_WORKERS = 4         # Background worker threads shared by all sessions
+PREFETCH_DEFAULT_BUDGET = 30     # Default max extra API calls per session
+PREFETCH_WAIT_SECONDS = 20       # Max wait for an in-flight prefetch or follow-up prediction
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Bounded worker pool shared by all sessions for speculative answers"""
+    return ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS, thread_name_prefix="ph-prefetch")
+
+class FollowUpPrefetcher:
+    """Per-session cache of answers pre-generated for suggested follow-up questions.
+
+    The follow-up questions themselves are also predicted in the background.
+    Answers and suggestions are only served for the same turn, provider and model
+    they were generated for. Worker threads never touch st.* - they only update
+    this object.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = {}   # normalized question -> {"future", "context", "expires_at"}
+        self._queue = []     # (key, fn) waiting for a free prefetch slot
+        self._in_flight = 0  # submitted calls not yet finished, from any turn
+        self._prediction = None    # follow-up prediction for the current turn
+        self._suggestions = None   # (context, questions) once predicted
+        self.calls_used = 0
+        self.questions = 0   # every question asked while prefetch is on
+        self.hits = 0        # hits/misses only count turns that had suggestions
+        self.misses = 0
+        self.wasted = 0
+        self.errors = 0
+
+    @staticmethod
+    def _normalize(question):
+        return " ".join(question.lower().split()).rstrip("?.! ")
+
+    def reserve_call(self, budget):
+        """Count one extra API call against the session budget (False if exhausted)"""
+        with self._lock:
+            if self.calls_used >= budget:
+                return False
+            self.calls_used += 1
+            return True
+
+    @staticmethod
+    def _new_entry(context):
+        return {
+            "future": None,
+            "context": context,
+            "expires_at": time.monotonic() + PREFETCH_TTL_SECONDS,
+            "dropped": False,   # removed from the cache without being served
+            "settled": False,   # done-callback has run
+        }
+
+    def _pump(self, executor, budget):
+        # Submit queued work while under the concurrency cap and spend limit.
+        # The follow-up prediction goes first since the answers depend on it.
+        with self._lock:
+            job = self._prediction
+            if job is not None and job["future"] is None and self._in_flight < PREFETCH_MAX_CONCURRENT:
+                if not self.reserve_call(budget):
+                    self._prediction = None
+                    return
+                self._in_flight += 1
+                job["future"] = executor.submit(job["fn"])
+                job["future"].add_done_callback(
+                    lambda _f, j=job: self._on_suggestions(j, executor, budget)
+                )
+            while self._queue and self._in_flight < PREFETCH_MAX_CONCURRENT:
+                key, fn = self._queue.pop(0)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if not self.reserve_call(budget):
+                    self._queue.clear()
+                    self._entries = {k: e for k, e in self._entries.items() if e["future"] is not None}
+                    break
+                self._in_flight += 1
+                entry["future"] = executor.submit(fn)
+                entry["future"].add_done_callback(
+                    lambda _f, e=entry: self._on_done(e, executor, budget)
+                )
+
+    def _on_done(self, entry, executor, budget):
+        # Runs in the worker thread (or inline when cancelled)
+        future = entry["future"]
+        with self._lock:
+            # Frees the slot whichever turn the call belonged to
+            self._in_flight -= 1
+            if not future.cancelled():
+                entry["settled"] = True
+                if entry["dropped"]:
+                    # Paid for but dropped while running (new turn, expiry, timeout)
+                    self._count_unused(future)
+            self._pump(executor, budget)
+
+    def _count_unused(self, future):
+        if future.exception() is not None:
+            self.errors += 1
+        else:
+            self.wasted += 1
+
+    def _expire(self):
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e["expires_at"] < now]:
+            self._discard(self._entries.pop(key))
+
+    def _discard(self, entry):
+        with self._lock:
+            entry["dropped"] = True
+            future = entry["future"]
+            if future is None:
+                return
+            if future.cancel():
+                # Never started: refund its reservation
+                self.calls_used -= 1
+            elif entry["settled"]:
+                self._count_unused(future)
+            # Otherwise still running: _on_done counts it when it finishes
+
+    def take(self, question, context):
+        """Return the prefetched answer for question, or None to generate it live.
+
+        Waits up to PREFETCH_WAIT_SECONDS if the answer is already being generated,
+        but not for one still queued behind other work in the shared pool.
+        """
+        key = self._normalize(question)
+        with self._lock:
+            self._expire()
+            self.questions += 1
+            if not (self._suggestions and self._suggestions[0] == context and self._suggestions[1]):
+                # Nothing was predicted for this turn (first question, budget
+                # spent, failed reply...), so it says nothing about the payoff
+                return None
+            entry = self._entries.pop(key, None)
+            self._queue = [(k, fn) for k, fn in self._queue if k != key]
+            if entry is None or entry["future"] is None or entry["context"] != context:
+                if entry is not None:
+                    self._discard(entry)
+                self.misses += 1
+                return None
+            if entry["future"].cancel():
+                # Still waiting for a worker: answering live is faster
+                self.calls_used -= 1
+                self.misses += 1
+                return None
+        try:
+            answer = entry["future"].result(timeout=PREFETCH_WAIT_SECONDS)
+        except FutureTimeoutError:
+            with self._lock:
+                self._discard(entry)
+                self.misses += 1
+            return None
+        except Exception:
+            with self._lock:
+                self.errors += 1
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return answer
+
+    def predict(self, executor, context, suggest_fn, answer_fn, budget):
+        """Predict follow-ups in the background, then queue prefetches of their answers.
+
+        suggest_fn() returns the questions; answer_fn(question) returns its answer.
+        """
+        with self._lock:
+            self._prediction = {
+                "fn": suggest_fn,
+                "answer_fn": answer_fn,
+                "context": context,
+                "future": None,
+                "deadline": time.monotonic() + PREFETCH_WAIT_SECONDS,
+                "stalled": False,
+            }
+            self._pump(executor, budget)
+
+    def _on_suggestions(self, job, executor, budget):
+        # Runs in the worker thread once the follow-up prediction finishes
+        future = job["future"]
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled():
+                pass
+            elif job["stalled"]:
+                pass  # Already counted as an error when it missed its deadline
+            elif self._prediction is not job:
+                # Conversation moved on while predicting
+                self._count_unused(future)
+            elif future.exception() is not None:
+                self._prediction = None
+                self.errors += 1
+                self._suggestions = (job["context"], [])
+            else:
+                self._prediction = None
+                questions = future.result()
+                self._suggestions = (job["context"], questions)
+                for question in questions:
+                    key = self._normalize(question)
+                    if key in self._entries:
+                        continue
+                    self._entries[key] = self._new_entry(job["context"])
+                    self._queue.append((key, functools.partial(job["answer_fn"], question)))
+            self._pump(executor, budget)
+
+    def suggestions(self, context):
+        """Return the predicted follow-ups for context, or None while still predicting"""
+        with self._lock:
+            job = self._prediction
+            if job is not None and job["context"] == context:
+                if time.monotonic() < job["deadline"]:
+                    return None
+                # Prediction stalled: give up so the app stops polling
+                self._prediction = None
+                self._suggestions = (context, [])
+                if job["future"] is None:
+                    pass
+                elif job["future"].cancel():
+                    self.calls_used -= 1
+                else:
+                    job["stalled"] = True
+                    self.errors += 1
+                return []
+            if self._suggestions is not None and self._suggestions[0] == context:
+                return list(self._suggestions[1])
+            return []
+
+    def invalidate(self):
+        """Drop every queued, running and cached prefetch (e.g. on a new turn)"""
+        with self._lock:
+            job, self._prediction = self._prediction, None
+            if job is not None and job["future"] is not None and job["future"].cancel():
+                # Never started: refund its reservation
+                self.calls_used -= 1
+            self._suggestions = None
+            self._queue.clear()
+            for entry in self._entries.values():
+                self._discard(entry)
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "questions": self.questions,
+                "served_rate": (self.hits / self.questions) if self.questions else 0.0,
+                "wasted": self.wasted,
+                "errors": self.errors,
+                "calls_used": self.calls_used,
+            }
+
+if 'prefetcher' not in st.session_state:
+    st.session_state.prefetcher = FollowUpPrefetcher()
+
+# Drop cached prefetches and suggestions when prefetch mode is switched
+def on_prefetch_toggle():
+    st.session_state.prefetcher.invalidate()
+
+# Queue a clicked follow-up suggestion as the next user prompt
+def queue_suggestion(question):
+    st.session_state.queued_prompt = question
+
+# Fragment body: rerun the whole app once background follow-up prediction is done
+def poll_follow_ups(context):
+    if st.session_state.prefetcher.suggestions(context) is not None:
+        st.rerun()
+
 # Helper function to render API key input with two-state design
 def render_api_key_input(provider_key, label):
     has_key = bool(st.session_state.api_keys[provider_key])
@@ -333,6 +613,7 @@ with st.sidebar:
     with col1:
         if st.button("🗑️ Clear", use_container_width=True):
             st.session_state.messages = []
+            st.session_state.prefetcher.invalidate()
             st.rerun()
 
     with col2:
@@ -363,6 +644,25 @@ with st.sidebar:
         user_msgs = len([m for m in st.session_state.messages if m["role"] == "user"])
         st.caption(f"💬 Messages: {msg_count} ({user_msgs} questions)")
 
+    # Speculative follow-up prefetching (extra API calls, lower latency)
+    prefetch_enabled = st.toggle(
+        "⚡ Prefetch follow-ups",
+        key="prefetch_enabled",
+        on_change=on_prefetch_toggle,
+        help="Suggest likely follow-up questions and pre-generate their answers in the background."
+    )
+    prefetch_stats_placeholder = None
+    if prefetch_enabled:
+        prefetch_budget = st.number_input(
+            "Max extra API calls per session",
+            min_value=0,
+            value=PREFETCH_DEFAULT_BUDGET,
+            step=5,
+            key="prefetch_budget"
+        )
+        # Filled in at the end of the run so metrics include this turn
+        prefetch_stats_placeholder = st.empty()
+
     st.divider()
 
     # Information section
@@ -429,6 +729,153 @@ Please ask me a health-related question instead."
 
 NEVER make exceptions. NEVER answer non-health questions even if the user insists."""
 
+# Instruction used to predict what the learner will ask next
+FOLLOW_UP_PROMPT = """You predict what a public health learner will ask next.
+Based on the conversation, reply with exactly {count} short follow-up questions the learner
+is most likely to ask next, one per line, with no numbering or extra text.
+Only suggest questions related to health, medicine, and wellness."""
+
+# --- PROVIDER CALLS ---
+# OpenAI, GitHub Models and Perplexity share the OpenAI-compatible API
+OPENAI_COMPATIBLE_BASE_URLS = {
+    "OpenAI": None,
+    "GitHub Models": "https://models.github.ai/inference",
+    "Perplexity": "https://api.perplexity.ai"
+}
+
+# Default output limits per provider
+DEFAULT_MAX_TOKENS = {"Anthropic": 4096}
+
+MISSING_API_KEY_MESSAGES = {
+    "OpenAI": "Please provide an OpenAI API key",
+    "Anthropic": "Please provide an Anthropic API key",
+    "Google Gemini": "Please provide a Google API key",
+    "GitHub Models": "Please provide a GitHub Token",
+    "Perplexity": "Please provide a Perplexity API key"
+}
+
+@st.cache_resource
+def get_gemini_configure_lock():
+    """Process-wide lock: genai.configure() sets the API key for every thread"""
+    return threading.Lock()
+
+# Resolved on the script thread so prefetch workers share the cached lock
+GEMINI_CONFIGURE_LOCK = get_gemini_configure_lock()
+
+def stream_response(provider, model, api_key, messages, client=None, system_prompt=None, max_tokens=None):
+    """Yield reply text chunks from the selected provider (no st.* calls, safe in worker threads)"""
+    system_prompt = system_prompt or SYSTEM_PROMPT
+    token_limit = max_tokens or DEFAULT_MAX_TOKENS.get(provider, 2000)
+
+    if provider == "Ollama (Local)":
+        # Prepare the conversation history with System Prompt at the start
+        history = [{'role': 'system', 'content': system_prompt}] + messages
+        stream = client.chat(
+            model=model,
+            messages=history,
+            stream=True,
+            options={'num_predict': max_tokens} if max_tokens else None,
+        )
+        for chunk in stream:
+            yield chunk['message']['content']
+
+    elif provider == "Anthropic":
+        from anthropic import Anthropic
+        anthropic_client = Anthropic(api_key=api_key)
+
+        # Anthropic doesn't use system role in messages, uses system parameter
+        with anthropic_client.messages.stream(
+            model=model,
+            max_tokens=token_limit,
+            system=system_prompt,
+            messages=messages,
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+
+    elif provider == "Google Gemini":
+        import google.generativeai as genai
+
+        # Configure generation settings
+        generation_config = genai.types.GenerationConfig(
+            max_output_tokens=token_limit,
+            temperature=0.7
+        )
+
+        # The model binds the configured client when the request starts, so hold
+        # the lock from configure() until then or a concurrent session's key
+        # could be used (the stream itself is read outside the lock)
+        with GEMINI_CONFIGURE_LOCK:
+            genai.configure(api_key=api_key)
+
+            gemini_model = genai.GenerativeModel(
+                model_name=model,
+                system_instruction=system_prompt
+            )
+
+            # Convert chat history to Gemini format
+            chat = gemini_model.start_chat(history=[
+                {"role": msg["role"] if msg["role"] == "user" else "model",
+                 "parts": [msg["content"]]}
+                for msg in messages[:-1]  # Exclude the current user message
+            ])
+
+            response = chat.send_message(messages[-1]["content"], stream=True, generation_config=generation_config)
+
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    else:
+        from openai import OpenAI
+        openai_client = OpenAI(base_url=OPENAI_COMPATIBLE_BASE_URLS[provider], api_key=api_key)
+
+        # Prepare messages with system prompt
+        stream = openai_client.chat.completions.create(
+            model=model,
+            messages=[{'role': 'system', 'content': system_prompt}] + messages,
+            stream=True,
+            max_tokens=token_limit,
+            temperature=0.7
+        )
+
+        for chunk in stream:
+            # GitHub Models may send chunks without choices (e.g. content filter results)
+            if not chunk.choices:
+                continue
+            content = getattr(chunk.choices[0].delta, 'content', None)
+            if content:
+                yield content
+
+def generate_response(provider, model, api_key, messages, client=None, system_prompt=None, max_tokens=None):
+    """Generate a complete reply (used by the prefetch workers)"""
+    return "".join(stream_response(
+        provider, model, api_key, messages,
+        client=client, system_prompt=system_prompt, max_tokens=max_tokens
+    ))
+
+def suggest_follow_ups(provider, model, api_key, messages, client=None, count=PREFETCH_SUGGESTION_COUNT):
+    """Ask the model for the learner's most likely next questions"""
+    request = messages + [{"role": "user", "content": "What will I most likely ask next?"}]
+    text = generate_response(
+        provider, model, api_key, request, client=client,
+        system_prompt=FOLLOW_UP_PROMPT.format(count=count), max_tokens=200
+    )
+    questions = []
+    for line in text.splitlines():
+        # Strip list markers ("- ", "1. ", "2) ") but keep questions starting with a number
+        line = re.sub(r"^\s*(?:[-*•]|\d+[.)])\s*", "", line).strip()
+        # Skip preambles like "Here are three questions:" - each suggestion is a paid prefetch
+        if line.endswith("?") and line not in questions:
+            questions.append(line)
+    return questions[:count]
+
+def answer_follow_up(provider, model, api_key, messages, question, client=None):
+    """Generate the answer to a suggested follow-up question"""
+    return generate_response(
+        provider, model, api_key, messages + [{"role": "user", "content": question}], client=client
+    )
+
 # --- CHAT LOGIC ---
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -444,8 +891,11 @@ for message in st.session_state.messages:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
-# Handle User Input
-if prompt := st.chat_input("Ask a health question..."):
+# Handle User Input (typed, or a clicked follow-up suggestion)
+if prompt := (st.chat_input("Ask a health question...") or st.session_state.pop("queued_prompt", None)):
+    prefetcher = st.session_state.prefetcher
+    prefetch_context = (len(st.session_state.messages), provider, selected_model)
+
     # 1. Show user message
     st.session_state.messages.append({"role": "user", "content": prompt})
     with st.chat_message("user"):
@@ -455,170 +905,29 @@ if prompt := st.chat_input("Ask a health question..."):
     with st.chat_message("assistant"):
         response_placeholder = st.empty()
         full_response = ""
+        response_ok = False
+
+        # Serve a prefetched answer if this question was predicted for this turn
+        prefetched_response = None
+        if prefetch_enabled:
+            with st.spinner("Thinking..."):
+                prefetched_response = prefetcher.take(prompt, prefetch_context)
+        prefetcher.invalidate()
 
         try:
-            if provider == "Ollama (Local)":
-                # Prepare the conversation history with System Prompt at the start
-                history = [{'role': 'system', 'content': SYSTEM_PROMPT}] + st.session_state.messages
-
-                # Stream the response from Ollama
-                stream = client.chat(
-                    model=selected_model,
-                    messages=history,
-                    stream=True,
-                )
+            if prefetched_response:
+                full_response = prefetched_response
 
-                for chunk in stream:
-                    content = chunk['message']['content']
+            elif provider != "Ollama (Local)" and not api_key:
+                st.error(MISSING_API_KEY_MESSAGES[provider])
+
+            else:
+                for content in stream_response(provider, selected_model, api_key, st.session_state.messages, client=client):
                     full_response += content
                     response_placeholder.markdown(full_response + "▌")
 
-            elif provider == "OpenAI":
-                if not api_key:
-                    st.error("Please provide an OpenAI API key")
-                else:
-                    from openai import OpenAI
-                    openai_client = OpenAI(api_key=api_key)
-
-                    # Prepare messages with system prompt
-                    messages = [{'role': 'system', 'content': SYSTEM_PROMPT}] + st.session_state.messages
-
-                    stream = openai_client.chat.completions.create(
-                        model=selected_model,
-                        messages=messages,
-                        stream=True,
-                        max_tokens=2000,
-                        temperature=0.7
-                    )
-
-                    for chunk in stream:
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            full_response += content
-                            response_placeholder.markdown(full_response + "▌")
-
-            elif provider == "Anthropic":
-                if not api_key:
-                    st.error("Please provide an Anthropic API key")
-                else:
-                    from anthropic import Anthropic
-                    anthropic_client = Anthropic(api_key=api_key)
-
-                    # Anthropic doesn't use system role in messages, uses system parameter
-                    messages = st.session_state.messages
-
-                    with anthropic_client.messages.stream(
-                        model=selected_model,
-                        max_tokens=4096,
-                        system=SYSTEM_PROMPT,
-                        messages=messages,
-                    ) as stream:
-                        for text in stream.text_stream:
-                            full_response += text
-                            response_placeholder.markdown(full_response + "▌")
-
-            elif provider == "Google Gemini":
-                if not api_key:
-                    st.error("Please provide a Google API key")
-                else:
-                    import google.generativeai as genai
-                    genai.configure(api_key=api_key)
-
-                    model = genai.GenerativeModel(
-                        model_name=selected_model,
-                        system_instruction=SYSTEM_PROMPT
-                    )
-
-                    # Convert chat history to Gemini format
-                    chat = model.start_chat(history=[
-                        {"role": msg["role"] if msg["role"] == "user" else "model",
-                         "parts": [msg["content"]]}
-                        for msg in st.session_state.messages[:-1]  # Exclude the current user message
-                    ])
-
-                    # Configure generation settings
-                    generation_config = genai.types.GenerationConfig(
-                        max_output_tokens=2000,
-                        temperature=0.7
-                    )
-
-                    response = chat.send_message(prompt, stream=True, generation_config=generation_config)
-
-                    for chunk in response:
-                        if chunk.text:
-                            full_response += chunk.text
-                            response_placeholder.markdown(full_response + "▌")
-
-            elif provider == "GitHub Models":
-                if not api_key:
-                    st.error("Please provide a GitHub Token")
-                else:
-                    from openai import OpenAI
-                    # GitHub Models uses OpenAI-compatible API
-                    github_client = OpenAI(
-                        base_url="https://models.github.ai/inference",
-                        api_key=api_key
-                    )
-
-                    # Prepare messages with system prompt
-                    messages = [{'role': 'system', 'content': SYSTEM_PROMPT}] + st.session_state.messages
-
-                    stream = github_client.chat.completions.create(
-                        model=selected_model,
-                        messages=messages,
-                        stream=True,
-                        max_tokens=2000,  # Increase token limit
-                        temperature=0.7
-                    )
-
-                    for chunk in stream:
-                        try:
-                            if chunk.choices and len(chunk.choices) > 0:
-                                delta = chunk.choices[0].delta
-                                if hasattr(delta, 'content') and delta.content:
-                                    content = delta.content
-                                    full_response += content
-                                    # Update display with every chunk for real-time streaming
-                                    response_placeholder.markdown(full_response + "▌")
-                        except (UnicodeEncodeError, IndexError, AttributeError):
-                            # Handle encoding issues and index errors gracefully - silently continue
-                            continue
-                        except Exception:
-                            # Catch any other errors but continue streaming - silently continue
-                            continue
-
-                    # Display final response without cursor
-                    response_placeholder.markdown(full_response)
-
-            elif provider == "Perplexity":
-                if not api_key:
-                    st.error("Please provide a Perplexity API key")
-                else:
-                    from openai import OpenAI
-                    # Perplexity uses OpenAI-compatible API
-                    perplexity_client = OpenAI(
-                        base_url="https://api.perplexity.ai",
-                        api_key=api_key
-                    )
-
-                    # Prepare messages with system prompt
-                    messages = [{'role': 'system', 'content': SYSTEM_PROMPT}] + st.session_state.messages
-
-                    stream = perplexity_client.chat.completions.create(
-                        model=selected_model,
-                        messages=messages,
-                        stream=True,
-                        max_tokens=2000,
-                        temperature=0.7
-                    )
-
-                    for chunk in stream:
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            full_response += content
-                            response_placeholder.markdown(full_response + "▌")
-
             response_placeholder.markdown(full_response)
+            response_ok = bool(full_response)
 
         except Exception as e:
             error_msg = str(e)
@@ -634,6 +943,44 @@ if prompt := st.chat_input("Ask a health question..."):
     if full_response:
         st.session_state.messages.append({"role": "assistant", "content": full_response})
 
+    # 4. Predict follow-ups and pre-generate their answers in the background
+    has_credentials = client is not None if provider == "Ollama (Local)" else bool(api_key)
+    if prefetch_enabled and response_ok and has_credentials:
+        history = list(st.session_state.messages)
+        prefetcher.predict(
+            get_prefetch_executor(),
+            (len(history), provider, selected_model),
+            functools.partial(suggest_follow_ups, provider, selected_model, api_key, history, client=client),
+            functools.partial(answer_follow_up, provider, selected_model, api_key, history, client=client),
+            prefetch_budget
+        )
+
+# Clickable follow-up suggestions
+if prefetch_enabled:
+    follow_up_context = (len(st.session_state.messages), provider, selected_model)
+    follow_ups = st.session_state.prefetcher.suggestions(follow_up_context)
+    if follow_ups is None:
+        # Still predicting: poll quietly, the app reruns once they are ready
+        st.fragment(poll_follow_ups, run_every=1)(follow_up_context)
+    elif follow_ups:
+        st.caption("💡 You might also ask:")
+        for i, question in enumerate(follow_ups):
+            st.button(
+                question,
+                key=f"follow_up_{len(st.session_state.messages)}_{i}",
+                on_click=queue_suggestion,
+                args=(question,)
+            )
+
+# Prefetch metrics (hit rate vs. extra calls spent)
+if prefetch_stats_placeholder is not None:
+    stats = st.session_state.prefetcher.stats()
+    prefetch_stats_placeholder.caption(
+        f"⚡ Hits: {stats['hits']} · Misses: {stats['misses']} · Hit rate: {stats['hit_rate']:.0%}\n\n"
+        f"💬 Served from prefetch: {stats['hits']}/{stats['questions']} questions ({stats['served_rate']:.0%})\n\n"
+        f"📞 Extra calls: {stats['calls_used']}/{prefetch_budget} · Unused: {stats['wasted']} · Errors: {stats['errors']}"
+    )
+
 # Footer Disclaimer - fixed bottom center (above chat input)
 st.markdown(
     """